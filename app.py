@@ -17,6 +17,7 @@ from components.validators import (
     validate_api_key,
     validate_language,
     validate_response_schema,
+    format_warnings,
     interpret_status_code,
     VALID_LANGUAGES
 )
@@ -34,7 +35,7 @@ from components.ui_components import (
     render_test_button,
     render_validation_errors,
     render_footer,
-    LANGUAGES
+    LANGUAGE_SIDEBAR_MD
 )
 
 # Page configuration
@@ -45,84 +46,16 @@ st.set_page_config(
     initial_sidebar_state="collapsed"
 )
 
-# Load custom CSS
+# Load custom CSS (read from disk once, then served from cache on every rerun)
+@st.cache_data
 def load_css():
     css_path = os.path.join(os.path.dirname(__file__), "assets", "style.css")
     if os.path.exists(css_path):
         with open(css_path, "r") as f:
-            st.markdown(f"<style>{f.read()}</style>", unsafe_allow_html=True)
+            return f"<style>{f.read()}</style>"
+    return ""
 
-load_css()
-
-# Additional inline styles for immediate effect
-st.markdown("""
-<style>
-    .stApp {
-        background: linear-gradient(135deg, #0f0f23 0%, #1a1a2e 50%, #16213e 100%);
-    }
-    .main-header {
-        text-align: center;
-        padding: 2rem 0;
-        margin-bottom: 2rem;
-        background: linear-gradient(135deg, rgba(102, 126, 234, 0.1) 0%, rgba(118, 75, 162, 0.1) 100%);
-        border-radius: 16px;
-        border: 1px solid rgba(255, 255, 255, 0.1);
-    }
-    .main-header h1 {
-        font-size: 2.5rem;
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        -webkit-background-clip: text;
-        -webkit-text-fill-color: transparent;
-        margin-bottom: 0.5rem;
-    }
-    .main-header .subtitle {
-        color: #a0a0a0;
-        font-size: 1.1rem;
-    }
-    .main-header .feature-badge {
-        color: #00ff88;
-        font-size: 0.9rem;
-        margin-top: 0.5rem;
-    }
-    .result-card {
-        display: flex;
-        align-items: center;
-        padding: 1.5rem;
-        border-radius: 12px;
-        margin: 1rem 0;
-    }
-    .result-pass {
-        background: linear-gradient(135deg, rgba(0, 255, 136, 0.15) 0%, rgba(0, 200, 100, 0.1) 100%);
-        border: 1px solid rgba(0, 255, 136, 0.3);
-    }
-    .result-fail {
-        background: linear-gradient(135deg, rgba(255, 0, 68, 0.15) 0%, rgba(200, 0, 50, 0.1) 100%);
-        border: 1px solid rgba(255, 0, 68, 0.3);
-    }
-    .result-warning {
-        background: linear-gradient(135deg, rgba(255, 170, 0, 0.15) 0%, rgba(200, 130, 0, 0.1) 100%);
-        border: 1px solid rgba(255, 170, 0, 0.3);
-    }
-    .result-icon {
-        font-size: 3rem;
-        margin-right: 1.5rem;
-    }
-    .result-content h3 {
-        margin: 0 0 0.5rem 0;
-        font-size: 1.5rem;
-        color: #ffffff;
-    }
-    .result-content p {
-        margin: 0;
-        color: #cccccc;
-    }
-    .footer {
-        text-align: center;
-        padding: 2rem 0;
-        color: #666666;
-    }
-</style>
-""", unsafe_allow_html=True)
+st.markdown(load_css(), unsafe_allow_html=True)
 
 # Render header
 render_header()
@@ -153,8 +86,7 @@ with st.sidebar:
     
     st.markdown("---")
     st.markdown("### 🗣️ Supported Languages")
-    for code, name in LANGUAGES.items():
-        st.markdown(f"- `{code}` → {name}")
+    st.markdown(LANGUAGE_SIDEBAR_MD)
     
     st.markdown("---")
     st.markdown("### ℹ️ Status Codes")
@@ -180,28 +112,37 @@ def validate_inputs(inputs):
     """Validate all inputs and return list of errors"""
     errors = []
     
-    # Validate endpoint URL
-    is_valid, error = validate_url(inputs["endpoint_url"])
-    if not is_valid:
-        errors.append(f"Endpoint URL: {error}")
-    
+    # Cheap checks first
     # Validate API key
     is_valid, error = validate_api_key(inputs["api_key"])
     if not is_valid:
         errors.append(f"API Key: {error}")
     
-    # Validate Base64 Audio
-    is_valid, error = validate_audio_base64(inputs["audio_base64"])
-    if not is_valid:
-        errors.append(f"Audio Base64: {error}")
-    
     # Validate language
     is_valid, error = validate_language(inputs["language"])
     if not is_valid:
         errors.append(f"Language: {error}")
     
+    # Validate endpoint URL
+    is_valid, error = validate_url(inputs["endpoint_url"])
+    if not is_valid:
+        errors.append(f"Endpoint URL: {error}")
+    
+    # Validate Base64 Audio (scans the whole string, so skip it if anything else failed)
+    if not errors:
+        is_valid, error = validate_audio_base64(inputs["audio_base64"])
+        if not is_valid:
+            errors.append(f"Audio Base64: {error}")
+    
     return errors
 
+# Keep one tester (and its pooled connections) per endpoint across reruns.
+# The cache is process-wide: all browser sessions share these testers and their
+# requests.Session, so entries are bounded and expire to release idle pools.
+@st.cache_resource(max_entries=16, ttl=1800)
+def get_tester(endpoint_url, api_key, timeout):
+    return APITester(endpoint_url=endpoint_url, api_key=api_key, timeout=timeout)
+
 # Test button
 if render_test_button():
     # Validate inputs first
@@ -213,17 +154,24 @@ if render_test_button():
     else:
         # Run the test
         with st.spinner("🔄 Testing API... Please wait..."):
-            # Create tester instance
-            tester = APITester(
+            # Get (cached) tester instance
+            tester = get_tester(
                 endpoint_url=inputs["endpoint_url"],
                 api_key=inputs["api_key"],
                 timeout=timeout
             )
             
+            # Build the payload once so the Request Details preview can reuse it
+            sent_payload = tester.build_payload(
+                audio_base64=inputs["audio_base64"],
+                language=inputs["language"]
+            )
+            
             # Execute test with Base64 only
             result = tester.get_result(
                 audio_base64=inputs["audio_base64"],
-                language=inputs["language"]
+                language=inputs["language"],
+                payload=sent_payload
             )
         
         # Display results
@@ -264,7 +212,7 @@ if render_test_button():
             is_valid_schema, schema_warnings = validate_response_schema(result.response_data)
             
             if schema_warnings:
-                render_schema_warnings(schema_warnings)
+                render_schema_warnings(format_warnings(schema_warnings))
             else:
                 st.success("✅ Response schema is valid!")
             
@@ -289,12 +237,12 @@ if render_test_button():
             
             st.markdown("**Payload:**")
             # Create a display payload (truncated Base64)
-            display_b64 = inputs["audio_base64"][:50] + "..." if len(inputs["audio_base64"]) > 50 else inputs["audio_base64"]
-            payload = tester.build_payload(
-                audio_base64=display_b64,
-                language=inputs["language"]
-            )
-            st.json(payload)
+            sent_b64 = sent_payload.get("audio_base64", "")
+            preview = {
+                **sent_payload,
+                "audio_base64": sent_b64[:50] + "..." if len(sent_b64) > 50 else sent_b64
+            }
+            st.json(preview)
 
 # Sample test section
 st.markdown("---")
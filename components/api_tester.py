@@ -1,7 +1,13 @@
+import http.cookiejar
 import requests
+from requests.adapters import HTTPAdapter
 import time
 from dataclasses import dataclass
 from typing import Dict, Any, Optional
+try:
+    import orjson
+except ImportError:
+    import json as orjson
 
 @dataclass
 class TestResult:
@@ -17,38 +23,69 @@ class APITester:
         self.endpoint_url = endpoint_url.strip()
         self.api_key = api_key.strip()
         self.timeout = timeout
-
-    def build_headers(self):
-        return {
+        self._headers = {
             "Content-Type": "application/json",
             "Accept": "application/json",
             "x-api-key": self.api_key
         }
 
+        # Reuse pooled connections (and their TLS sessions) across test runs
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        self._session.headers.update(self._headers)
+        # ...but never persist cookies: each test must start as independent as a bare
+        # requests.post, and cached testers are shared across browser sessions
+        self._session.cookies.set_policy(http.cookiejar.DefaultCookiePolicy(allowed_domains=[]))
+
+    def build_headers(self):
+        return self._headers
+
     def build_payload(self, audio_base64: str, language: str):
+        # Only pay for a strip() copy when there is whitespace to remove
+        if audio_base64 and (audio_base64[0].isspace() or audio_base64[-1].isspace()):
+            audio_base64 = audio_base64.strip()
         return {
             "language": language,
             "audio_format": "mp3",
-            "audio_base64": audio_base64.strip()
+            "audio_base64": audio_base64
         }
 
-    def get_result(self, audio_base64: str, language: str = "auto"):
+    def get_result(self, audio_base64: str, language: str = "auto", payload: Optional[Dict[str, Any]] = None):
+        if payload is None:
+            payload = self.build_payload(audio_base64, language)
+
         start = time.perf_counter()
 
         try:
-            res = requests.post(
+            res = self._session.post(
                 self.endpoint_url,
-                json=self.build_payload(audio_base64, language),
-                headers=self.build_headers(),
+                data=orjson.dumps(payload),
                 timeout=self.timeout
             )
 
             latency = (time.perf_counter() - start) * 1000
 
+            # Only parse bodies that are (or look like) JSON; HTML error pages and empty bodies are skipped
+            data = None
+            body = res.content
+            if body and (
+                "json" in res.headers.get("content-type", "").lower()
+                or body[:64].lstrip()[:1] in (b"{", b"[")
+            ):
+                try:
+                    # Parse straight from the body bytes, skipping requests' charset sniffing
+                    data = orjson.loads(body)
+                except ValueError:
+                    data = None
+
+            # Keep the whole body (tracebacks end with the actual error), in its declared
+            # charset; UTF-8 when none is declared, instead of requests' charset sniffing
             try:
-                data = res.json()
-            except:
-                data = None
+                raw = body.decode(res.encoding or "utf-8", "replace")
+            except LookupError:
+                raw = body.decode("utf-8", "replace")
 
             return TestResult(
                 success=200 <= res.status_code < 300,
@@ -56,7 +93,7 @@ class APITester:
                 latency_ms=round(latency, 2),
                 response_data=data,
                 error_message="",
-                raw_response=res.text
+                raw_response=raw
             )
 
         except Exception as e:
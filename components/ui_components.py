@@ -17,6 +17,12 @@ LANGUAGES = {
     "te": "🇮🇳 Telugu"
 }
 
+# Language selectbox options
+LANGUAGE_CODES = tuple(LANGUAGES.keys())
+
+# Sidebar language list, rendered as a single markdown block
+LANGUAGE_SIDEBAR_MD = "\n".join(f"- `{code}` → {name}" for code, name in LANGUAGES.items())
+
 
 def render_header():
     """Render the main header with styling"""
@@ -75,8 +81,8 @@ def render_input_section() -> Dict[str, Any]:
     with col1:
         language = st.selectbox(
             "🗣️ Language",
-            options=list(LANGUAGES.keys()),
-            format_func=lambda x: LANGUAGES[x],
+            options=LANGUAGE_CODES,
+            format_func=LANGUAGES.__getitem__,
             help="Select the language of the audio or Auto Detect"
         )
     
@@ -3,13 +3,21 @@ Validators Module - Request/Response Validation
 Enhanced with new schema: classification, explanation, language validation
 """
 import re
-import base64
-from urllib.parse import urlparse
-from typing import Dict, Any, Tuple, List
+import textwrap
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Any, Tuple, List, Mapping
+
+import numpy as np
 
 
 # Valid Languages
 VALID_LANGUAGES = ["auto", "en", "hi", "ta", "ml", "te"]
+VALID_LANGUAGES_SET = frozenset(VALID_LANGUAGES)
+
+
+# Maximum accepted Base64 audio length (characters)
+MAX_AUDIO_BASE64_LENGTH = 15_000_000
 
 
 # Expected Response Schema (Updated)
@@ -21,23 +29,61 @@ EXPECTED_SCHEMA = {
 }
 
 
+# Precompiled patterns (group 1 of _URL_RE is the domain, group 1 of _B64_RE the padding)
+_URL_RE = re.compile(r"\s*https?://([^/?#\s]*)", re.IGNORECASE)
+_AUDIO_URL_RE = re.compile(r"\s*https?://[^/?#\s]+/[^?#]*\.(?:mp3|wav)(?:[?#]|\Z)", re.IGNORECASE)
+_B64_RE = re.compile(r"[A-Za-z0-9+/]*(={0,2})")
+
+
+def _url_input_error(url: Any) -> str:
+    """
+    Type/emptiness guard shared by the URL validators (runs before any cache lookup)
+    Returns: error_message, or "" if url is a non-blank string
+    """
+    if not url:
+        return "URL cannot be empty"
+    if not isinstance(url, str):
+        return "URL must be a string"
+    if url.isspace():
+        return "URL cannot be empty"
+    return ""
+
+
+# The cached validators below are pure, so results are memoized per argument value;
+# harnesses that retest the same endpoint/audio URL hit the cache.
+@lru_cache(maxsize=2048)
+def _validate_url_str(url: str) -> Tuple[bool, str]:
+    # Leading whitespace is skipped by the pattern itself, so no stripped copy is made
+    match = _URL_RE.match(url)
+    if match is None:
+        return False, "URL must start with http:// or https://"
+    if not match.group(1):
+        return False, "Invalid URL format - missing domain"
+    return True, ""
+
+
 def validate_url(url: str) -> Tuple[bool, str]:
     """
     Validate if URL format is correct
     Returns: (is_valid, error_message)
     """
-    if not url or not url.strip():
-        return False, "URL cannot be empty"
-    
-    try:
-        parsed = urlparse(url.strip())
-        if parsed.scheme not in ['http', 'https']:
-            return False, "URL must start with http:// or https://"
-        if not parsed.netloc:
-            return False, "Invalid URL format - missing domain"
+    error = _url_input_error(url)
+    if error:
+        return False, error
+    return _validate_url_str(url)
+
+
+@lru_cache(maxsize=2048)
+def _validate_audio_url_str(url: str) -> Tuple[bool, str]:
+    # Scheme, domain and .mp3/.wav extension (before any query/fragment) in one pass
+    if _AUDIO_URL_RE.match(url):
         return True, ""
-    except Exception as e:
-        return False, f"URL parsing error: {str(e)}"
+    
+    # Fall back to the general URL check only to report a specific error
+    is_valid_url, error = _validate_url_str(url)
+    if not is_valid_url:
+        return False, error
+    return False, "Audio URL must end with .mp3 or .wav"
 
 
 def validate_audio_url(url: str) -> Tuple[bool, str]:
@@ -45,16 +91,10 @@ def validate_audio_url(url: str) -> Tuple[bool, str]:
     Validate if audio URL has valid format (.mp3 or .wav)
     Returns: (is_valid, error_message)
     """
-    is_valid_url, error = validate_url(url)
-    if not is_valid_url:
+    error = _url_input_error(url)
+    if error:
         return False, error
-    
-    # Check for valid audio extensions
-    lower_url = url.lower().split('?')[0]  # Remove query params
-    if not (lower_url.endswith('.mp3') or lower_url.endswith('.wav')):
-        return False, "Audio URL must end with .mp3 or .wav"
-    
-    return True, ""
+    return _validate_audio_url_str(url)
 
 
 def validate_audio_base64(base64_string: str) -> Tuple[bool, str]:
@@ -65,22 +105,28 @@ def validate_audio_base64(base64_string: str) -> Tuple[bool, str]:
     if not base64_string or not base64_string.strip():
         return False, "Base64 audio data cannot be empty"
     
+    if len(base64_string) > MAX_AUDIO_BASE64_LENGTH:
+        return False, f"Base64 audio data is too large (max {MAX_AUDIO_BASE64_LENGTH:,} characters)"
+    
     # Remove any potential data URI prefix
     cleaned = base64_string.strip()
     if cleaned.startswith('data:'):
         return False, "Remove data URI prefix (e.g., 'data:audio/mp3;base64,'). Provide only the Base64 content."
     
-    # Check if it's valid Base64
-    try:
-        # Try to decode to verify it's valid Base64
-        decoded = base64.b64decode(cleaned, validate=True)
-        if len(decoded) < 100:
-            return False, "Base64 data seems too short for an audio file"
-        return True, ""
-    except Exception as e:
-        return False, f"Invalid Base64 encoding: {str(e)}"
+    # Check if it's valid Base64 (alphabet + padding scan, no decoded buffer allocated)
+    match = _B64_RE.fullmatch(cleaned)
+    if match is None:
+        return False, "Invalid Base64 encoding: Only base64 data is allowed"
+    if len(cleaned) % 4:
+        return False, "Invalid Base64 encoding: Incorrect padding"
+    
+    # Decoded size follows from the length and padding
+    if (len(cleaned) // 4) * 3 - len(match.group(1)) < 100:
+        return False, "Base64 data seems too short for an audio file"
+    return True, ""
 
 
+@lru_cache(maxsize=2048)
 def validate_api_key(api_key: str) -> Tuple[bool, str]:
     """
     Validate API key is not empty
@@ -91,102 +137,226 @@ def validate_api_key(api_key: str) -> Tuple[bool, str]:
     return True, ""
 
 
+@lru_cache(maxsize=2048)
 def validate_language(language: str) -> Tuple[bool, str]:
     """
     Validate if language is in the allowed list
     Returns: (is_valid, error_message)
     """
-    if language not in VALID_LANGUAGES:
+    if language not in VALID_LANGUAGES_SET:
         return False, f"Invalid language '{language}'. Allowed: {VALID_LANGUAGES}"
     return True, ""
 
 
-def validate_response_schema(response: Dict[str, Any]) -> Tuple[bool, List[str]]:
+# Schema warning messages, keyed by warning code. Validators return (code, arg)
+# pairs and only format_warnings turns them into text.
+_WARNING_MESSAGES = {
+    "missing_field": "Missing required field: '{}'",
+    "invalid_status": f"Invalid status value: '{{}}'. Expected: {EXPECTED_SCHEMA['valid_status']}",
+    "invalid_classification": f"Invalid classification value: '{{}}'. Expected: {EXPECTED_SCHEMA['valid_classifications']}",
+    "deprecated_result": "Using deprecated 'result' field. Should use 'classification' instead.",
+    "confidence_range": "Confidence should be between 0 and 1, got: {}",
+    "confidence_type": "Confidence should be a number, got: {}",
+    "empty_explanation": "Explanation field is empty. Should provide reasoning for the classification.",
+    "invalid_language": f"Invalid language value: '{{}}'. Expected: {VALID_LANGUAGES}",
+    "extra_fields": "Extra fields in response: {}",
+}
+
+
+def format_warnings(warnings: List[Tuple[str, Any]]) -> List[str]:
     """
-    Validate if response matches expected schema (Updated)
-    Returns: (is_valid, list_of_warnings)
+    Turn (code, arg) schema warnings into display messages
     """
-    warnings = []
-    is_valid = True
-    
-    # Check required fields
-    for field in EXPECTED_SCHEMA["required_fields"]:
-        if field not in response:
-            warnings.append(f"Missing required field: '{field}'")
-            is_valid = False
-    
-    # Validate 'status' field
-    if "status" in response:
-        if response["status"] not in EXPECTED_SCHEMA["valid_status"]:
-            warnings.append(f"Invalid status value: '{response['status']}'. Expected: {EXPECTED_SCHEMA['valid_status']}")
-    
-    # Validate 'classification' field (new - replaces 'result')
-    if "classification" in response:
-        if response["classification"] not in EXPECTED_SCHEMA["valid_classifications"]:
-            warnings.append(f"Invalid classification value: '{response['classification']}'. Expected: {EXPECTED_SCHEMA['valid_classifications']}")
-    
+    return [_WARNING_MESSAGES[code].format(arg) for code, arg in warnings]
+
+
+# Value checks emitted into the compiled response validator, in order.
+# Each entry is (fields that must be present, fields that must be absent, code);
+# the code sees the response as `r` and appends (code, arg) pairs to `warnings`.
+_FIELD_CHECKS = (
+    (("status",), (), """
+v = r["status"]
+if not (isinstance(v, str) and v in _vs):
+    warnings.append(("invalid_status", v))
+"""),
+    (("classification",), (), """
+v = r["classification"]
+if not (isinstance(v, str) and v in _vc):
+    warnings.append(("invalid_classification", v))
+"""),
     # Backward compatibility: check for old 'result' field
-    if "result" in response and "classification" not in response:
-        warnings.append("Using deprecated 'result' field. Should use 'classification' instead.")
-    
-    # Validate 'confidence' field
-    if "confidence" in response:
-        try:
-            conf = float(response["confidence"])
-            if conf < 0 or conf > 1:
-                warnings.append(f"Confidence should be between 0 and 1, got: {conf}")
-        except (ValueError, TypeError):
-            warnings.append(f"Confidence should be a number, got: {type(response['confidence']).__name__}")
-    
-    # Validate 'explanation' field
-    if "explanation" in response:
-        if not response["explanation"] or not str(response["explanation"]).strip():
-            warnings.append("Explanation field is empty. Should provide reasoning for the classification.")
-    
-    # Validate 'language' field if present
-    if "language" in response:
-        if response["language"] not in VALID_LANGUAGES:
-            warnings.append(f"Invalid language value: '{response['language']}'. Expected: {VALID_LANGUAGES}")
+    (("result",), ("classification",), """
+warnings.append(("deprecated_result", None))
+"""),
+    (("confidence",), (), """
+v = r["confidence"]
+try:
+    conf = float(v)
+except (ValueError, TypeError):
+    warnings.append(("confidence_type", type(v).__name__))
+else:
+    if conf < 0 or conf > 1:
+        warnings.append(("confidence_range", conf))
+"""),
+    (("explanation",), (), """
+v = r["explanation"]
+if not v or not str(v).strip():
+    warnings.append(("empty_explanation", None))
+"""),
+    (("language",), (), """
+v = r["language"]
+if not (isinstance(v, str) and v in _vl):
+    warnings.append(("invalid_language", v))
+"""),
+)
+
+
+def _make_validator(schema: Dict[str, Any], keys: frozenset):
+    """
+    Compile a response schema into a straight-line validator function specialized
+    for responses with exactly the given keys (no key-presence checks at runtime)
+    Returns: function(response) -> (is_valid, list_of_(code, arg)_warnings)
+    """
+    namespace = {
+        "_vs": frozenset(schema["valid_status"]),
+        "_vc": frozenset(schema["valid_classifications"]),
+        "_vl": VALID_LANGUAGES_SET,
+    }
     
-    # Check for extra unexpected fields
-    all_expected = set(EXPECTED_SCHEMA["required_fields"] + EXPECTED_SCHEMA["optional_fields"])
-    # Also allow deprecated 'result' field for backward compatibility
-    all_expected.add("result")
-    extra_fields = set(response.keys()) - all_expected
+    lines = [
+        "def _validate(r, _vs=_vs, _vc=_vc, _vl=_vl):",
+        "    warnings = []",
+    ]
+    # Required fields, resolved against the known keys
+    missing = [field for field in schema["required_fields"] if field not in keys]
+    for field in missing:
+        lines.append(f"    warnings.append(('missing_field', {field!r}))")
+    # Value checks for the fields this shape actually has
+    for present, absent, code in _FIELD_CHECKS:
+        if keys.issuperset(present) and keys.isdisjoint(absent):
+            lines.append(textwrap.indent(code.strip("\n"), " " * 4))
+    # Deprecated 'result' field is still allowed for backward compatibility
+    extra_fields = keys - frozenset(schema["required_fields"] + schema["optional_fields"] + ["result"])
     if extra_fields:
-        warnings.append(f"Extra fields in response: {list(extra_fields)}")
+        # Bound by reference rather than spliced into the source: keys come from the API
+        namespace["_extra"] = list(extra_fields)
+        lines.append("    warnings.append(('extra_fields', list(_extra)))")
+    lines.append(f"    return {not missing}, warnings")
     
-    return is_valid, warnings
+    exec(compile("\n".join(lines), "<response_validator>", "exec"), namespace)
+    return namespace["_validate"]
+
+
+@lru_cache(maxsize=64)
+def _compiled_for(keys: frozenset):
+    """
+    Get the compiled validator for one response shape (set of keys)
+    """
+    return _make_validator(EXPECTED_SCHEMA, keys)
+
+
+def validate_response_schema(response: Dict[str, Any]) -> Tuple[bool, List[Tuple[str, Any]]]:
+    """
+    Validate if response matches expected schema (Updated)
+    Returns: (is_valid, list_of_warnings) - warnings are (code, arg) pairs, see format_warnings
+    """
+    return _compiled_for(frozenset(response))(response)
+
+
+# HTTP status code verdicts (read-only, shared across calls)
+_STATUS_MAP = {
+    code: MappingProxyType({"verdict": verdict, "message": message, "severity": severity})
+    for code, (verdict, message, severity) in {
+        200: ("PASS", "Success - API responded correctly", "success"),
+        201: ("PASS", "Created - Request processed", "success"),
+        400: ("FAIL", "Bad Request - Check your payload format", "error"),
+        401: ("FAIL", "Unauthorized - Invalid or missing API key", "error"),
+        403: ("FAIL", "Forbidden - API key lacks permissions", "error"),
+        404: ("FAIL", "Not Found - Wrong endpoint URL", "error"),
+        405: ("FAIL", "Method Not Allowed - Endpoint doesn't accept POST", "error"),
+        408: ("FAIL", "Request Timeout - API took too long", "warning"),
+        422: ("FAIL", "Unprocessable Entity - Invalid data format", "error"),
+        429: ("FAIL", "Too Many Requests - Rate limit exceeded", "warning"),
+        500: ("FAIL", "Internal Server Error - API crashed", "error"),
+        502: ("FAIL", "Bad Gateway - Server unreachable", "error"),
+        503: ("FAIL", "Service Unavailable - API is down", "error"),
+        504: ("FAIL", "Gateway Timeout - Server didn't respond", "error"),
+    }.items()
+}
 
+# Verdict/severity bases for codes outside the table
+_PASS_2XX = MappingProxyType({"verdict": "PASS", "severity": "success"})
+_FAIL_4XX = MappingProxyType({"verdict": "FAIL", "severity": "error"})
+_FAIL_5XX = MappingProxyType({"verdict": "FAIL", "severity": "error"})
+_UNKNOWN = MappingProxyType({"verdict": "UNKNOWN", "severity": "warning"})
 
-def interpret_status_code(status_code: int) -> Dict[str, Any]:
+
+def interpret_status_code(status_code: int) -> Mapping[str, Any]:
     """
     Interpret HTTP status code and return verdict
     """
-    status_map = {
-        200: {"verdict": "PASS", "message": "Success - API responded correctly", "severity": "success"},
-        201: {"verdict": "PASS", "message": "Created - Request processed", "severity": "success"},
-        400: {"verdict": "FAIL", "message": "Bad Request - Check your payload format", "severity": "error"},
-        401: {"verdict": "FAIL", "message": "Unauthorized - Invalid or missing API key", "severity": "error"},
-        403: {"verdict": "FAIL", "message": "Forbidden - API key lacks permissions", "severity": "error"},
-        404: {"verdict": "FAIL", "message": "Not Found - Wrong endpoint URL", "severity": "error"},
-        405: {"verdict": "FAIL", "message": "Method Not Allowed - Endpoint doesn't accept POST", "severity": "error"},
-        408: {"verdict": "FAIL", "message": "Request Timeout - API took too long", "severity": "warning"},
-        422: {"verdict": "FAIL", "message": "Unprocessable Entity - Invalid data format", "severity": "error"},
-        429: {"verdict": "FAIL", "message": "Too Many Requests - Rate limit exceeded", "severity": "warning"},
-        500: {"verdict": "FAIL", "message": "Internal Server Error - API crashed", "severity": "error"},
-        502: {"verdict": "FAIL", "message": "Bad Gateway - Server unreachable", "severity": "error"},
-        503: {"verdict": "FAIL", "message": "Service Unavailable - API is down", "severity": "error"},
-        504: {"verdict": "FAIL", "message": "Gateway Timeout - Server didn't respond", "severity": "error"},
-    }
-    
-    if status_code in status_map:
-        return status_map[status_code]
+    known = _STATUS_MAP.get(status_code)
+    if known is not None:
+        return known
     elif 200 <= status_code < 300:
-        return {"verdict": "PASS", "message": f"Success ({status_code})", "severity": "success"}
+        return dict(_PASS_2XX, message=f"Success ({status_code})")
     elif 400 <= status_code < 500:
-        return {"verdict": "FAIL", "message": f"Client Error ({status_code})", "severity": "error"}
+        return dict(_FAIL_4XX, message=f"Client Error ({status_code})")
     elif status_code >= 500:
-        return {"verdict": "FAIL", "message": f"Server Error ({status_code})", "severity": "error"}
+        return dict(_FAIL_5XX, message=f"Server Error ({status_code})")
     else:
-        return {"verdict": "UNKNOWN", "message": f"Unexpected status code: {status_code}", "severity": "warning"}
+        return dict(_UNKNOWN, message=f"Unexpected status code: {status_code}")
+
+
+def validate_responses_batch(responses: List[Dict[str, Any]]) -> List[Tuple[bool, List[Tuple[str, Any]]]]:
+    """
+    Validate many responses against the expected schema
+    Returns: list of (is_valid, list_of_warnings), one per response
+    """
+    compiled_for = _compiled_for
+    return [compiled_for(frozenset(response))(response) for response in responses]
+
+
+# Lookup arrays for interpret_status_codes_batch, sorted by status code
+_KNOWN_CODES = np.array(sorted(_STATUS_MAP), dtype=np.int64)
+_KNOWN_VERDICTS = np.array([_STATUS_MAP[c]["verdict"] for c in _KNOWN_CODES.tolist()], dtype=object)
+_KNOWN_MESSAGES = np.array([_STATUS_MAP[c]["message"] for c in _KNOWN_CODES.tolist()], dtype=object)
+_KNOWN_SEVERITIES = np.array([_STATUS_MAP[c]["severity"] for c in _KNOWN_CODES.tolist()], dtype=object)
+
+# Codes outside the table, by range: 2xx, 4xx, 5xx+, anything else
+_RANGE_BASES = (_PASS_2XX, _FAIL_4XX, _FAIL_5XX, _UNKNOWN)
+_RANGE_VERDICTS = np.array([base["verdict"] for base in _RANGE_BASES], dtype=object)
+_RANGE_SEVERITIES = np.array([base["severity"] for base in _RANGE_BASES], dtype=object)
+_RANGE_MESSAGES = ("Success ({})", "Client Error ({})", "Server Error ({})", "Unexpected status code: {}")
+
+
+def interpret_status_codes_batch(codes) -> Dict[str, np.ndarray]:
+    """
+    Interpret many HTTP status codes at once (vectorized interpret_status_code)
+    Returns: dict of "verdict", "message" and "severity" 1-D arrays aligned with codes
+    """
+    codes = np.atleast_1d(np.asarray(codes, dtype=np.int64))
+    if codes.ndim != 1:
+        raise ValueError("codes must be a scalar or a 1-D sequence of status codes")
+    
+    # Known codes: binary search into the sorted table
+    idx = np.minimum(np.searchsorted(_KNOWN_CODES, codes), len(_KNOWN_CODES) - 1)
+    known = _KNOWN_CODES[idx] == codes
+    
+    # Everything else falls back to its range
+    ranges = np.select(
+        [(codes >= 200) & (codes < 300), (codes >= 400) & (codes < 500), codes >= 500],
+        [0, 1, 2],
+        default=3
+    )
+    
+    messages = np.where(known, _KNOWN_MESSAGES[idx], None)
+    # Range messages embed the code, so only these are formatted one by one
+    for i in np.flatnonzero(~known).tolist():
+        messages[i] = _RANGE_MESSAGES[ranges[i]].format(codes[i])
+    
+    return {
+        "verdict": np.where(known, _KNOWN_VERDICTS[idx], _RANGE_VERDICTS[ranges]),
+        "message": messages,
+        "severity": np.where(known, _KNOWN_SEVERITIES[idx], _RANGE_SEVERITIES[ranges]),
+    }
@@ -2,12 +2,21 @@
 Utility Helper Functions
 """
 import time
-from datetime import datetime
+from bisect import bisect_right
+
+
+# Last formatted timestamp, keyed on its epoch second: [second, formatted]
+_TS_CACHE = [-1, ""]
 
 
 def get_timestamp() -> str:
     """Get current timestamp in ISO format"""
-    return datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ")
+    now = int(time.time())
+    if now != _TS_CACHE[0]:
+        t = time.gmtime(now)
+        _TS_CACHE[1] = f"{t.tm_year:04d}-{t.tm_mon:02d}-{t.tm_mday:02d}T{t.tm_hour:02d}:{t.tm_min:02d}:{t.tm_sec:02d}Z"
+        _TS_CACHE[0] = now
+    return _TS_CACHE[1]
 
 
 def format_latency(ms: float) -> str:
@@ -18,22 +27,22 @@ def format_latency(ms: float) -> str:
         return f"{ms/1000:.2f} s"
 
 
+# Latency bands (ms upper bounds) and their colors
+_LATENCY_THRESHOLDS = (500, 1000, 2000, 3000)
+_LATENCY_COLORS = (
+    "#00ff88",  # Green - excellent
+    "#88ff00",  # Light green - good
+    "#ffaa00",  # Orange - acceptable
+    "#ff6600",  # Dark orange - slow
+    "#ff0044",  # Red - too slow
+)
+
+
 def get_latency_color(ms: float) -> str:
     """Get color based on latency value"""
-    if ms < 500:
-        return "#00ff88"  # Green - excellent
-    elif ms < 1000:
-        return "#88ff00"  # Light green - good
-    elif ms < 2000:
-        return "#ffaa00"  # Orange - acceptable
-    elif ms < 3000:
-        return "#ff6600"  # Dark orange - slow
-    else:
-        return "#ff0044"  # Red - too slow
+    return _LATENCY_COLORS[bisect_right(_LATENCY_THRESHOLDS, ms)]
 
 
 def truncate_string(s: str, max_length: int = 100) -> str:
     """Truncate string with ellipsis"""
-    if len(s) <= max_length:
-        return s
-    return s[:max_length-3] + "..."
+    return s if len(s) <= max_length else f"{s[:max_length-3]}..."